@@ -12,7 +12,7 @@ from __future__ import annotations
 import sys
 
 from collections.abc import Iterable, Mapping, Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from structlog.exceptions import DropEvent
 
@@ -21,8 +21,10 @@ from .typing import BindableLogger, Context, Processor, WrappedLogger
 
 if sys.version_info >= (3, 11):
     from typing import Self
-else:
+elif TYPE_CHECKING:  # pragma: no cover
     from typing_extensions import Self
+else:
+    Self = Any
 
 
 class BoundLoggerBase:
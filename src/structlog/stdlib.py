@@ -21,13 +21,15 @@ import warnings
 
 from collections.abc import Callable, Collection, Iterable, Sequence
 from functools import partial
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 
 if sys.version_info >= (3, 11):
     from typing import Self
-else:
+elif TYPE_CHECKING:  # pragma: no cover
     from typing_extensions import Self
+else:
+    Self = Any
 
 
 from . import _config
@@ -19,6 +19,7 @@ import sys
 from collections.abc import Callable, Mapping, MutableMapping
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Protocol,
     TextIO,
@@ -29,8 +30,10 @@ from typing import (
 
 if sys.version_info >= (3, 11):
     from typing import Self
-else:
+elif TYPE_CHECKING:  # pragma: no cover
     from typing_extensions import Self
+else:
+    Self = Any
 
 
 WrappedLogger: TypeAlias = Any
@@ -120,8 +123,13 @@ class ExceptionTransformer(Protocol):
         example, a string or a JSON-serializable structure.
 
     .. versionadded:: 22.1.0
+    .. versionchanged:: 26.2.0
+       Declares empty ``__slots__``, so implementations that subclass it can
+       use ``__slots__`` to avoid per-instance dictionaries.
     """
 
+    __slots__ = ()
+
     def __call__(self, exc_info: ExcInfo) -> Any: ...
 
 
@@ -132,8 +140,13 @@ class BindableLogger(Protocol):
     by *structlog*.
 
     .. versionadded:: 20.2.0
+    .. versionchanged:: 26.2.0
+       Declares empty ``__slots__``, so implementations that subclass it can
+       use ``__slots__`` to avoid per-instance dictionaries.
     """
 
+    __slots__ = ()
+
     @property
     def _context(self) -> Context: ...
 
@@ -162,9 +175,14 @@ class FilteringBoundLogger(BindableLogger, Protocol):
     .. versionadded:: 25.5.0
        String interpolation using dictionary-based arguments if the first and
        only argument is a mapping.
+    .. versionchanged:: 26.2.0
+       Declares empty ``__slots__``, so implementations that subclass it can
+       use ``__slots__`` to avoid per-instance dictionaries.
 
     """
 
+    __slots__ = ()
+
     def bind(self, **new_values: Any) -> FilteringBoundLogger:
         """
         Return a new logger with *new_values* added to the existing ones.
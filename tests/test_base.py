@@ -3,6 +3,8 @@
 # 2.0, and the MIT License.  See the LICENSE file in the root of this
 # repository for complete details.
 
+from typing import get_type_hints
+
 import pytest
 
 from structlog import get_context
@@ -48,6 +50,13 @@ class TestBinding:
 
         assert b._context != b1._context != b2._context
 
+    def test_self_annotations_resolve(self):
+        """
+        Return annotations using Self can be resolved at runtime, even if
+        typing_extensions is only imported for type checkers.
+        """
+        assert "return" in get_type_hints(BoundLoggerBase.bind)
+
     def test_new_clears_state(self):
         """
         Calling new() on a logger clears the context.
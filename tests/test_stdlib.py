@@ -13,7 +13,7 @@ import sys
 
 from collections.abc import Callable, Collection
 from io import StringIO
-from typing import Any
+from typing import Any, get_type_hints
 from unittest.mock import patch
 
 import pytest
@@ -208,6 +208,13 @@ class TestBoundLogger:
 
         assert method_name == getattr(bl, method_name)("event")
 
+    def test_self_annotations_resolve(self):
+        """
+        Return annotations using Self can be resolved at runtime, even if
+        typing_extensions is only imported for type checkers.
+        """
+        assert "return" in get_type_hints(BoundLogger.bind)
+
     def test_proxies_to_correct_method_special_cases(self):
         """
         Fatal maps to critical and warn to warning.
@@ -1550,6 +1557,13 @@ class TestAsyncBoundLogger:
         """
         assert isinstance(abl, BindableLogger)
 
+    def test_self_annotations_resolve(self):
+        """
+        Return annotations using Self can be resolved at runtime, even if
+        typing_extensions is only imported for type checkers.
+        """
+        assert "return" in get_type_hints(AsyncBoundLogger.bind)
+
     @pytest.mark.asyncio
     async def test_correct_levels(self, abl, cl, stdlib_log_method):
         """
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the MIT License.  See the LICENSE file in the root of this
+# repository for complete details.
+
+from typing import get_type_hints
+
+from structlog.typing import BindableLogger
+
+
+class SlottedBindableLogger(BindableLogger):
+    """
+    Explicit, slotted implementation of the BindableLogger protocol.
+    """
+
+    __slots__ = ("x",)
+
+    _context = {}
+
+    def bind(self, **new_values):
+        return self
+
+    unbind = try_unbind = new = bind
+
+
+class TestBindableLogger:
+    def test_self_annotations_resolve(self):
+        """
+        Return annotations using Self can be resolved at runtime, even if
+        typing_extensions is only imported for type checkers.
+        """
+        assert "return" in get_type_hints(BindableLogger.bind)
+
+    def test_slots(self):
+        """
+        The protocol doesn't add a __dict__ to subclasses that use __slots__.
+        """
+        bl = SlottedBindableLogger()
+
+        assert not hasattr(bl, "__dict__")
+
+    def test_slotted_isinstance(self):
+        """
+        Slotted subclasses are still recognized as bound loggers.
+        """
+        assert isinstance(SlottedBindableLogger(), BindableLogger)